@@ -10,8 +10,10 @@ import json
 import time
 import io
 import contextlib
+from collections import deque
 import streamlit as st
 import pandas as pd
+import polars as pl
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -22,10 +24,50 @@ from src.reporter import generate_war_room_brief
 # ── Paths ────────────────────────────────────────────────────────────────────
 
 DATA_CSV = "data/mock_data.csv"
+DATA_PARQUET = "data/mock_data.parquet"
 VIOLATIONS_CSV = "outputs/violations.csv"
+VIOLATIONS_PARQUET = "outputs/violations.parquet"
 SUMMARY_JSON = "outputs/summary_stats.json"
 REPORT_MD = "outputs/executive_report.md"
 FILTERED_CSV = "outputs/filtered_results.csv"
+FILTERED_PARQUET = "outputs/filtered_results.parquet"
+
+
+# ── Cached Loaders ───────────────────────────────────────────────────────────
+# Streamlit re-runs this script top-to-bottom on every widget interaction.
+# Cache file reads keyed on (path, mtime) so a rerun only re-parses when the
+# pipeline has actually rewritten the file.
+
+@st.cache_data(show_spinner=False)
+def _load_csv(path: str, mtime: float) -> pd.DataFrame:
+    # Polars parses CSV multi-threaded; convert to pandas only because the
+    # styled tables below rely on DataFrame.style.
+    return pl.read_csv(path).to_pandas()
+
+
+# Known mock-data schema: supplying dtypes skips inference and halves the
+# memory (and Arrow frame bytes sent to the browser) via narrow numerics.
+_RAW_DTYPES = {
+    "Price": pl.Float32,
+    "Days_in_Warehouse": pl.Int16,
+    "Profit_Per_Item": pl.Float32,
+}
+
+
+@st.cache_data(show_spinner=False)
+def _load_raw_csv(path: str, mtime: float) -> pd.DataFrame:
+    return pl.read_csv(path, schema_overrides=_RAW_DTYPES).to_pandas()
+
+
+@st.cache_data(show_spinner=False)
+def _load_parquet(path: str, mtime: float) -> pd.DataFrame:
+    return pl.read_parquet(path).to_pandas()
+
+
+@st.cache_data(show_spinner=False)
+def _load_json(path: str, mtime: float) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 # ── Dark Mode CSS ────────────────────────────────────────────────────────────
@@ -144,7 +186,33 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-st.markdown(DARK_CSS, unsafe_allow_html=True)
+@st.cache_resource
+def _dark_css() -> str:
+    # Cached once per server process — reruns reuse the same string object
+    # instead of rebuilding/re-hashing the ~3 KB style block.
+    return DARK_CSS
+
+
+st.markdown(_dark_css(), unsafe_allow_html=True)
+
+# Stat every artifact once per rerun: mtime if present, None if missing.
+# All existence checks below go through this dict instead of os.path.exists.
+paths_state = {
+    p: os.path.getmtime(p) if os.path.exists(p) else None
+    for p in [
+        DATA_CSV, DATA_PARQUET,
+        FILTERED_CSV, FILTERED_PARQUET,
+        VIOLATIONS_CSV, VIOLATIONS_PARQUET,
+        SUMMARY_JSON, REPORT_MD,
+    ]
+}
+
+# Load summary stats once per rerun — sidebar, top bar, and terminal all reuse it.
+stats = (
+    _load_json(SUMMARY_JSON, paths_state[SUMMARY_JSON])
+    if paths_state[SUMMARY_JSON] is not None
+    else None
+)
 
 
 # ── Helper: Metric Card ─────────────────────────────────────────────────────
@@ -161,26 +229,136 @@ def metric_card(icon: str, value: str, label: str, color_class: str = "metric-bl
 
 # ── Helper: Agent Terminal Log ───────────────────────────────────────────────
 
+# Tag → CSS class, keyed on the leading "[TAG]" token (one dict lookup per line)
+_LOG_CLS = {
+    "[OK]": "log-ok",
+    "[WARN]": "log-warn",
+    "[ERR]": "log-err",
+    "[STEP]": "log-step",
+    "[>>]": "log-step",
+}
+
+
 def render_agent_terminal(logs: list[str]) -> str:
     """Render a list of log lines as a styled terminal block."""
     lines_html = []
     for line in logs:
-        if line.startswith("[OK]"):
-            cls = "log-ok"
-        elif line.startswith("[WARN]"):
-            cls = "log-warn"
-        elif line.startswith("[ERR]"):
-            cls = "log-err"
-        elif line.startswith("[STEP]") or line.startswith("[>>]"):
-            cls = "log-step"
-        else:
-            cls = "log-dim"
+        tag = line[: line.find("]") + 1] if line.startswith("[") else ""
+        cls = _LOG_CLS.get(tag, "log-dim")
         lines_html.append(f'<span class="{cls}">{line}</span>')
-    
+
     content = "<br>".join(lines_html)
     return f'<div class="agent-terminal">{content}</div>'
 
 
+# ── Helper: Report fragment ──────────────────────────────────────────────────
+
+@st.fragment
+def render_report_view(report_text: str) -> None:
+    """
+    Render the executive report, violations table, and action buttons inside
+    one isolated fragment: clicking approve/send/export re-runs only this
+    block, so the multi-KB report markdown and the styled table are not
+    re-shipped through the websocket for the rest of the page.
+    """
+    # Report in a styled card
+    st.markdown('<div class="report-card">', unsafe_allow_html=True)
+    st.markdown(report_text)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.divider()
+
+    # Violations table
+    st.markdown('<div class="section-header">Violation Details</div>', unsafe_allow_html=True)
+
+    if paths_state[VIOLATIONS_PARQUET] is not None:
+        df_violations = _load_parquet(VIOLATIONS_PARQUET, paths_state[VIOLATIONS_PARQUET])
+    elif paths_state[VIOLATIONS_CSV] is not None:
+        df_violations = _load_csv(VIOLATIONS_CSV, paths_state[VIOLATIONS_CSV])
+    else:
+        df_violations = None
+
+    if df_violations is not None:
+        styled = df_violations.style.apply(style_status_column, subset=["Status"])
+        st.dataframe(styled, use_container_width=True, height=280)
+        st.caption(f"{len(df_violations)} violations flagged across {df_violations['Status'].nunique()} categories")
+
+    st.divider()
+
+    # Action buttons
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("✅ Approve Actions", type="primary", use_container_width=True):
+            st.balloons()
+            st.success("Actions approved. Compliance directives queued for execution.")
+
+    with col2:
+        if st.button("📧 Send to Stakeholders", use_container_width=True):
+            st.info("📨 Report dispatched to stakeholder channel (simulated)")
+
+    with col3:
+        st.download_button(
+            label="📥 Export Report",
+            data=report_text,
+            file_name="executive_action_report.md",
+            mime="text/markdown",
+            use_container_width=True,
+        )
+
+
+# ── Helper: Status column styling ────────────────────────────────────────────
+
+_STATUS_CSS = pd.Series({
+    "Liquidation": "background-color: #f8514933; color: #f85149",
+    "Review": "background-color: #d2992233; color: #d29922",
+    "VIP_Keep": "background-color: #3fb95033; color: #3fb950",
+    "Normal": "background-color: #161b22; color: #8b949e",
+})
+
+
+def style_status_column(s: pd.Series):
+    """Vectorized styler: one reindex over the column instead of a Python call per cell."""
+    return _STATUS_CSS.reindex(s).fillna("").to_numpy()
+
+
+# ── Helper: Live stdout sink ─────────────────────────────────────────────────
+
+def classify_pipeline_line(line: str) -> str | None:
+    """Map a raw runtime stdout line to a tagged terminal log line (or None to drop)."""
+    stripped = line.strip()
+    if not stripped or stripped.startswith("="):
+        return None
+    if "✅" in stripped or "PASS" in stripped:
+        return f"[OK] {stripped}"
+    elif "❌" in stripped or "FAIL" in stripped:
+        return f"[ERR] {stripped}"
+    elif "💾" in stripped or "📂" in stripped or "⚡" in stripped:
+        return f"[STEP] {stripped}"
+    return f"     {stripped}"
+
+
+class _LiveSink(io.TextIOBase):
+    """
+    Line-buffered stdout sink. Forwards each completed line to a callback as it
+    is written, so pipeline logs stream into the terminal instead of appearing
+    all at once after the run — and the full output is never held in memory.
+    """
+
+    def __init__(self, emit):
+        self._emit = emit
+        self._buf = ""
+
+    def write(self, s: str) -> int:
+        self._buf += s
+        while "\n" in self._buf:
+            line, self._buf = self._buf.split("\n", 1)
+            msg = classify_pipeline_line(line)
+            if msg is not None:
+                self._emit(msg)
+        return len(s)
+
+
 # ── Sidebar ──────────────────────────────────────────────────────────────────
 
 with st.sidebar:
@@ -193,41 +371,35 @@ with st.sidebar:
     run_clicked = st.button("▶ Run SOP Compiler", type="primary", use_container_width=True)
     
     if run_clicked:
-        logs = []
+        logs = deque(maxlen=12)  # bounded: only the visible tail is ever kept
         log_container = st.empty()
-        
+        last_flush = [0.0]
+
         def add_log(msg: str):
             logs.append(msg)
-            log_container.markdown(render_agent_terminal(logs[-12:]), unsafe_allow_html=True)
+            # Re-render at most every 50ms — each markdown call round-trips
+            # through the websocket. [OK]/[ERR]/[WARN] lines always flush so
+            # the terminal never ends on a stale frame (every terminal line of
+            # the run handler carries one of these tags).
+            now = time.monotonic()
+            if now - last_flush[0] > 0.05 or msg.startswith(("[OK]", "[ERR]", "[WARN]")):
+                last_flush[0] = now
+                log_container.markdown(render_agent_terminal(list(logs)), unsafe_allow_html=True)
         
         try:
             add_log("[STEP] Initializing pipeline...")
             add_log(f"[>>] Loading data from {DATA_CSV}")
-            time.sleep(0.3)
-            
-            # Capture runtime output
+
+            # Stream runtime output into the terminal as it is printed
             add_log("[STEP] Executing runtime pipeline...")
             add_log("[>>] Dynamically importing verified_filter.py")
-            
-            stdout_capture = io.StringIO()
-            with contextlib.redirect_stdout(stdout_capture):
+
+            with contextlib.redirect_stdout(_LiveSink(add_log)):
                 summary = run_pipeline()
-            
-            runtime_output = stdout_capture.getvalue()
-            for line in runtime_output.strip().split("\n"):
-                stripped = line.strip()
-                if stripped and not stripped.startswith("="):
-                    if "✅" in stripped or "PASS" in stripped:
-                        add_log(f"[OK] {stripped}")
-                    elif "❌" in stripped or "FAIL" in stripped:
-                        add_log(f"[ERR] {stripped}")
-                    elif "💾" in stripped or "📂" in stripped or "⚡" in stripped:
-                        add_log(f"[STEP] {stripped}")
-                    else:
-                        add_log(f"     {stripped}")
-            
+
             st.session_state["pipeline_run"] = True
             st.session_state["summary"] = summary
+            stats = summary  # refresh the pre-loaded stats for this rerun
             
             add_log("[STEP] Generating Executive Action Report...")
             add_log("[>>] Reporter Agent: Executive Compliance Officer persona")
@@ -242,6 +414,12 @@ with st.sidebar:
                 add_log(f"[OK] Pipeline complete — {summary['total_violations']} violations detected")
             else:
                 add_log("[WARN] Report generation failed. Stats available.")
+
+            # Re-stat the artifacts the pipeline just (re)wrote, so the rest
+            # of this same rerun renders the fresh files instead of serving
+            # cached frames keyed on pre-run mtimes
+            for p in paths_state:
+                paths_state[p] = os.path.getmtime(p) if os.path.exists(p) else None
             
         except Exception as e:
             add_log(f"[ERR] Pipeline error: {str(e)}")
@@ -251,10 +429,7 @@ with st.sidebar:
     # Live metric cards in sidebar
     st.markdown('<div class="section-header">Live Metrics</div>', unsafe_allow_html=True)
     
-    if os.path.exists(SUMMARY_JSON):
-        with open(SUMMARY_JSON, "r") as f:
-            stats = json.load(f)
-        
+    if stats is not None:
         st.markdown(
             metric_card("📊", str(stats["total_items"]), "Records Scanned"),
             unsafe_allow_html=True,
@@ -281,10 +456,7 @@ st.markdown("# ⚙️ Agentic SOP Compiler")
 st.caption("Deterministic Rule Enforcement via Code Generation · Powered by LangGraph + Cerebras gpt-oss-120b")
 
 # Top metric bar (if stats exist)
-if os.path.exists(SUMMARY_JSON):
-    with open(SUMMARY_JSON, "r") as f:
-        stats = json.load(f)
-    
+if stats is not None:
     c1, c2, c3, c4, c5 = st.columns(5)
     c1.markdown(metric_card("📊", str(stats["total_items"]), "Total Records"), unsafe_allow_html=True)
     c2.markdown(metric_card("🚨", str(stats["liquidation"]["count"]), "Flagged", "metric-red"), unsafe_allow_html=True)
@@ -301,37 +473,43 @@ if not view_mode:
     # ── RAW DATA VIEW ────────────────────────────────────────────────────
     st.markdown('<div class="section-header">Raw Dataset</div>', unsafe_allow_html=True)
     
-    if os.path.exists(DATA_CSV):
-        df_raw = pd.read_csv(DATA_CSV)
+    # Prefer the Parquet sidecar when the generator produced one
+    if paths_state[DATA_PARQUET] is not None:
+        df_raw = _load_parquet(DATA_PARQUET, paths_state[DATA_PARQUET])
+    elif paths_state[DATA_CSV] is not None:
+        df_raw = _load_raw_csv(DATA_CSV, paths_state[DATA_CSV])
+    else:
+        df_raw = None
+
+    if df_raw is not None:
         st.dataframe(df_raw, use_container_width=True, height=350)
         st.caption(f"{len(df_raw)} records · {len(df_raw.columns)} columns")
     else:
         st.warning("No data found. Run `scripts/generate_mock_data.py` first.")
     
-    if os.path.exists(FILTERED_CSV):
+    if paths_state[FILTERED_PARQUET] is not None or paths_state[FILTERED_CSV] is not None:
         st.markdown('<div class="section-header">Classified Results</div>', unsafe_allow_html=True)
-        df_filtered = pd.read_csv(FILTERED_CSV)
-        
+        if paths_state[FILTERED_PARQUET] is not None:
+            df_filtered = _load_parquet(FILTERED_PARQUET, paths_state[FILTERED_PARQUET])
+        else:
+            df_filtered = _load_csv(FILTERED_CSV, paths_state[FILTERED_CSV])
+        # Categorical Status: categories come back sorted, so the options list
+        # is O(1) instead of two full-column unique+sort scans, and
+        # value_counts/styling below get the categorical fast path too.
+        df_filtered["Status"] = df_filtered["Status"].astype("category")
+        status_options = list(df_filtered["Status"].cat.categories)
+
         col_filter, col_chart = st.columns([2, 1])
-        
+
         with col_filter:
             status_filter = st.multiselect(
                 "Filter by Status:",
-                options=sorted(df_filtered["Status"].unique()),
-                default=sorted(df_filtered["Status"].unique()),
+                options=status_options,
+                default=status_options,
             )
             df_display = df_filtered[df_filtered["Status"].isin(status_filter)]
-            
-            def color_status(val):
-                colors = {
-                    "Liquidation": "background-color: #f8514933; color: #f85149",
-                    "Review": "background-color: #d2992233; color: #d29922",
-                    "VIP_Keep": "background-color: #3fb95033; color: #3fb950",
-                    "Normal": "background-color: #161b22; color: #8b949e",
-                }
-                return colors.get(val, "")
-            
-            styled = df_display.style.map(color_status, subset=["Status"])
+
+            styled = df_display.style.apply(style_status_column, subset=["Status"])
             st.dataframe(styled, use_container_width=True, height=350)
         
         with col_chart:
@@ -345,58 +523,12 @@ else:
     report_text = None
     if "report" in st.session_state:
         report_text = st.session_state["report"]
-    elif os.path.exists(REPORT_MD):
+    elif paths_state[REPORT_MD] is not None:
         with open(REPORT_MD, "r") as f:
             report_text = f.read()
     
     if report_text:
-        # Report in a styled card
-        st.markdown(f'<div class="report-card">', unsafe_allow_html=True)
-        st.markdown(report_text)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.divider()
-        
-        # Violations table
-        st.markdown('<div class="section-header">Violation Details</div>', unsafe_allow_html=True)
-        
-        if os.path.exists(VIOLATIONS_CSV):
-            df_violations = pd.read_csv(VIOLATIONS_CSV)
-            
-            def color_violations(val):
-                colors = {
-                    "Liquidation": "background-color: #f8514933; color: #f85149",
-                    "Review": "background-color: #d2992233; color: #d29922",
-                    "VIP_Keep": "background-color: #3fb95033; color: #3fb950",
-                }
-                return colors.get(val, "")
-            
-            styled = df_violations.style.map(color_violations, subset=["Status"])
-            st.dataframe(styled, use_container_width=True, height=280)
-            st.caption(f"{len(df_violations)} violations flagged across {df_violations['Status'].nunique()} categories")
-        
-        st.divider()
-        
-        # Action buttons
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("✅ Approve Actions", type="primary", use_container_width=True):
-                st.balloons()
-                st.success("Actions approved. Compliance directives queued for execution.")
-        
-        with col2:
-            if st.button("📧 Send to Stakeholders", use_container_width=True):
-                st.info("📨 Report dispatched to stakeholder channel (simulated)")
-        
-        with col3:
-            st.download_button(
-                label="📥 Export Report",
-                data=report_text,
-                file_name="executive_action_report.md",
-                mime="text/markdown",
-                use_container_width=True,
-            )
+        render_report_view(report_text)
     else:
         st.markdown(
             """
@@ -417,10 +549,8 @@ st.divider()
 with st.expander("🖥️ Agent Terminal — Pipeline Execution Log", expanded=False):
     if "pipeline_run" in st.session_state:
         # Show a reconstructed log from the summary stats
-        if os.path.exists(SUMMARY_JSON):
-            with open(SUMMARY_JSON, "r") as f:
-                s = json.load(f)
-            
+        if stats is not None:
+            s = stats
             terminal_logs = [
                 "[STEP] Pipeline initialized",
                 f"[>>] Loaded {s['total_items']} records from {DATA_CSV}",
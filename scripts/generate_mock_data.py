@@ -11,72 +11,41 @@ Rigged Data Strategy:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # Set seed for reproducibility
 np.random.seed(42)
 
-# Initialize data
-data = []
-
-# Rows 0-79: Normal data (Age < 100, Profit > $10)
-for i in range(80):
-    item_name = f"Widget_{i+1:03d}"
-    price = np.random.uniform(20, 100)
-    days_in_warehouse = np.random.randint(10, 100)
-    profit_per_item = np.random.uniform(10, 50)
-    data.append({
-        "Item_Name": item_name,
-        "Price": round(price, 2),
-        "Days_in_Warehouse": days_in_warehouse,
-        "Profit_Per_Item": round(profit_per_item, 2)
-    })
-
-# Rows 80-89: Trigger Liquidation (Age = 200, Profit = $4)
-for i in range(10):
-    item_name = f"Widget_{81+i:03d}"
-    price = 50
-    days_in_warehouse = 200
-    profit_per_item = 4.00
-    data.append({
-        "Item_Name": item_name,
-        "Price": price,
-        "Days_in_Warehouse": days_in_warehouse,
-        "Profit_Per_Item": profit_per_item
-    })
-
-# Rows 90-94: Trigger Review (Age = 50, Profit = $2)
-for i in range(5):
-    item_name = f"Widget_{91+i:03d}"
-    price = 30
-    days_in_warehouse = 50
-    profit_per_item = 2.00
-    data.append({
-        "Item_Name": item_name,
-        "Price": price,
-        "Days_in_Warehouse": days_in_warehouse,
-        "Profit_Per_Item": profit_per_item
-    })
-
-# Rows 95-99: Trigger VIP Exception (Age = 250, Profit = $25)
-for i in range(5):
-    item_name = f"Widget_{96+i:03d}"
-    price = 75
-    days_in_warehouse = 250
-    profit_per_item = 25.00
-    data.append({
-        "Item_Name": item_name,
-        "Price": price,
-        "Days_in_Warehouse": days_in_warehouse,
-        "Profit_Per_Item": profit_per_item
-    })
-
-# Create DataFrame
-df = pd.DataFrame(data)
-
-# Save to CSV
-df.to_csv("data/mock_data.csv", index=False)
+# Item names for all 100 rows in one vectorized pass
+item_names = [f"Widget_{i:03d}" for i in range(1, 101)]
+
+# Rows 0-79: Normal data (Age < 100, Profit > $10) — drawn as whole columns
+normal_prices = np.round(np.random.uniform(20, 100, 80), 2)
+normal_days = np.random.randint(10, 100, 80)
+normal_profits = np.round(np.random.uniform(10, 50, 80), 2)
+
+# Rigged segments: Liquidation (10), Review (5), VIP Exception (5)
+prices = np.concatenate([normal_prices, np.full(10, 50.0), np.full(5, 30.0), np.full(5, 75.0)])
+days_in_warehouse = np.concatenate([normal_days, np.full(10, 200), np.full(5, 50), np.full(5, 250)])
+profits = np.concatenate([normal_profits, np.full(10, 4.00), np.full(5, 2.00), np.full(5, 25.00)])
+
+# Create DataFrame from column arrays (no per-row dict allocation)
+df = pd.DataFrame({
+    "Item_Name": item_names,
+    "Price": prices,
+    "Days_in_Warehouse": days_in_warehouse,
+    "Profit_Per_Item": profits,
+})
+
+# Save to CSV, plus a Parquet sidecar — columnar reads beat re-parsing
+# the CSV for every component that loads this file. Arrow writes the CSV
+# from its columnar buffers in one C call (no per-row Python formatting).
+pacsv.write_csv(pa.Table.from_pandas(df), "data/mock_data.csv")
+df.to_parquet("data/mock_data.parquet", engine="pyarrow", compression="zstd")
 
 print("✅ data/mock_data.csv generated successfully!")
+print("✅ data/mock_data.parquet generated successfully!")
 print(f"Total rows: {len(df)}")
 print("\nData Summary:")
 print(df.describe())
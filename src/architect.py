@@ -6,8 +6,30 @@ GENERALIST: Works with ANY schema and ANY set of SOP rules.
 """
 
 import os
+import re
 import json
+import hashlib
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Filesystem cache for generated scripts — an unchanged schema+rules pair
+# skips the LLM round-trip entirely on re-runs.
+CACHE_DIR = ".cache/architect"
+
+# One pooled session for the module — generate/fix calls run back-to-back,
+# so keeping the TLS connection alive saves a handshake per retry. Transient
+# API errors (rate limit / gateway) retry with exponential backoff instead of
+# surfacing straight into the engine loop.
+_RETRIES = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["POST"],
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_RETRIES))
 
 
 def _call_cerebras(prompt: str, temperature: float = 0.1) -> str:
@@ -54,25 +76,23 @@ def _call_cerebras(prompt: str, temperature: float = 0.1) -> str:
         "temperature": temperature
     }
     
-    response = requests.post(url, headers=headers, json=data)
-    
+    response = _SESSION.post(url, headers=headers, json=data, timeout=(3.05, 60))
+
     if response.status_code != 200:
         raise RuntimeError(f"Cerebras API error: {response.status_code} - {response.text}")
     
-    response_data = response.json()
+    # orjson parses the raw bytes directly — skips requests' text decode + stdlib json
+    response_data = orjson.loads(response.content)
     return response_data["choices"][0]["message"]["content"]
 
 
+# Leading/trailing fences only — anchored so fences inside the code survive
+_FENCE_RE = re.compile(r"\A\s*```(?:python)?[ \t]*\n?|\n?```\s*\Z")
+
+
 def _strip_markdown_fences(code: str) -> str:
-    """Remove markdown code fences if LLM includes them."""
-    code = code.strip()
-    if code.startswith("```python"):
-        code = code[len("```python"):].strip()
-    if code.startswith("```"):
-        code = code[3:].strip()
-    if code.endswith("```"):
-        code = code[:-3].strip()
-    return code
+    """Remove markdown code fences if LLM includes them (single regex pass)."""
+    return _FENCE_RE.sub("", code).strip()
 
 
 def generate_filter_script(schema_str: str, rules_json: str, csv_path: str = "mock_data.csv", output_path: str = "filtered_results.csv") -> str:
@@ -89,6 +109,15 @@ def generate_filter_script(schema_str: str, rules_json: str, csv_path: str = "mo
     Returns:
         Python code string for the filter script
     """
+    cache_key = hashlib.blake2b(
+        (schema_str + rules_json + csv_path + output_path).encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.py")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            return f.read()
+
     prompt = f"""Write a complete Python script that classifies rows in a dataset based on business rules.
 
 ## DATA SCHEMA
@@ -100,15 +129,17 @@ def generate_filter_script(schema_str: str, rules_json: str, csv_path: str = "mo
 ## INSTRUCTIONS
 1. Import pandas (and numpy if needed) at the top.
 2. Define a function `apply_filters(df)` that:
-   - Creates a new column called 'Status' with default value 'Normal'.
    - Reads EACH rule from the BUSINESS RULES JSON above.
-   - For each rule, translate `condition_logic` into a vectorized Pandas mask (using df.loc[mask, 'Status'] = ...).
+   - Extracts the columns the rules need as NumPy arrays first (e.g. `days = df['Days_in_Warehouse'].to_numpy()`).
+   - Translates each rule's `condition_logic` into a vectorized boolean mask over those arrays.
+   - Assigns the 'Status' column exactly ONCE, in a single fused pass:
+     `df['Status'] = np.select(conditions, choices, default='Normal')`.
    - CRITICAL — EXCEPTION HANDLING:
      * If a rule has an `exception_logic` field (non-null), it means that exception OVERRIDES the parent rule.
      * Exceptions are higher priority than their parent conditions.
-     * Apply rules in order from LOWEST priority to HIGHEST priority, so that higher-priority statuses overwrite lower-priority ones.
+     * np.select takes the FIRST matching condition, so order `conditions` from HIGHEST priority to LOWEST (exceptions before their parent rules).
      * General principle: specific rules (exceptions) override general rules.
-   - Do NOT use for loops over rows. Use only vectorized Pandas operations.
+   - Do NOT use for loops over rows. Use only vectorized NumPy/Pandas operations.
    - Returns the modified DataFrame.
 3. The script's `if __name__ == "__main__"` block must:
    - Load `{csv_path}` using pandas.
@@ -119,7 +150,13 @@ def generate_filter_script(schema_str: str, rules_json: str, csv_path: str = "mo
 5. Return ONLY raw Python code. No markdown fences, no explanations, no comments about what you're doing."""
 
     response = _call_cerebras(prompt)
-    return _strip_markdown_fences(response)
+    code = _strip_markdown_fences(response)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, "w") as f:
+        f.write(code)
+
+    return code
 
 
 def fix_filter_script(broken_code: str, error_msg: str, schema_str: str, csv_path: str = "mock_data.csv", output_path: str = "filtered_results.csv") -> str:
@@ -3,69 +3,104 @@ context_loader.py
 Extracts CSV schema and sample data for prompt injection into the Architect agent.
 """
 
+import os
+from functools import lru_cache
+
 import pandas as pd
 from typing import Optional
 
 
-def get_csv_context(file_path: str, save_to_file: bool = False) -> str:
+def get_csv_context(file_path: str, df: Optional[pd.DataFrame] = None, save_to_file: bool = False) -> str:
     """
     Load a CSV file and return formatted context: schema + first 3 rows.
-    
+
     Args:
         file_path: Path to the CSV file
+        df: Optional pre-loaded DataFrame — skips re-reading the CSV when the
+            caller (e.g. the runtime pipeline) already has it in memory
         save_to_file: If True, save output to context.txt
-        
+
     Returns:
         Formatted string with DATA SCHEMA and sample rows
     """
+    if df is not None:
+        context = _format_context(df.head(3), len(df))
+    else:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return f"ERROR: File not found: {file_path}"
+        context = _context_from_file(file_path, stat.st_mtime, stat.st_size)
+
+    # Save to file if requested
+    if save_to_file and not context.startswith("ERROR"):
+        with open("outputs/context.txt", "w") as f:
+            f.write(context)
+        print("✅ Context saved to outputs/context.txt")
+
+    return context
+
+
+@lru_cache(maxsize=32)
+def _context_from_file(file_path: str, mtime: float, size: int) -> str:
+    """
+    Build context from disk, memoized on (path, mtime, size) — the size guards
+    against same-second rewrites that mtime granularity can miss.
+    Only the first 3 rows are parsed; the total row count comes from a
+    plain line count, so the build stays O(3 rows) for large CSVs.
+    """
     try:
-        df = pd.read_csv(file_path)
+        if file_path.endswith(".parquet"):
+            # Parquet keeps schema + row count in the footer — read only the
+            # first batch, never the whole file
+            import pyarrow.parquet as pq
+
+            pf = pq.ParquetFile(file_path)
+            sample = next(pf.iter_batches(batch_size=3)).to_pandas()
+            return _format_context(sample, pf.metadata.num_rows)
+        sample = pd.read_csv(file_path, nrows=3)
     except FileNotFoundError:
         return f"ERROR: File not found: {file_path}"
     except Exception as e:
         return f"ERROR: Failed to read CSV: {str(e)}"
-    
-    if df.empty:
+
+    if sample.empty:
         return "ERROR: CSV file is empty"
-    
+
+    with open(file_path) as f:
+        total_rows = sum(1 for _ in f) - 1  # minus header
+
+    return _format_context(sample, total_rows)
+
+
+def _format_context(sample_rows: pd.DataFrame, total_rows: int) -> str:
+    """Format schema + sample rows into the Architect's context string."""
+    if sample_rows.empty:
+        return "ERROR: CSV file is empty"
+
     # Get column names
-    columns = list(df.columns)
+    columns = list(sample_rows.columns)
     column_str = ", ".join(columns)
-    
+
     # Get data types
-    dtypes_str = ", ".join([f"{col}: {str(df[col].dtype)}" for col in columns])
-    
-    # Get first 3 rows
-    sample_rows = df.head(3)
-    
-    # Build markdown table header
-    header_row = "| " + " | ".join(columns) + " |"
-    separator_row = "| " + " | ".join(["---"] * len(columns)) + " |"
-    
-    # Build data rows
-    data_rows = []
-    for _, row in sample_rows.iterrows():
-        row_str = "| " + " | ".join([str(val) for val in row]) + " |"
-        data_rows.append(row_str)
-    
+    dtypes_str = ", ".join([f"{col}: {str(sample_rows[col].dtype)}" for col in columns])
+
+    # Markdown sample table — to_markdown renders all rows in one pass,
+    # no per-cell Python boxing via iterrows
+    sample_md = sample_rows.to_markdown(index=False)
+
     # Construct final output
-    context = f"""DATA SCHEMA:
-- Columns: [{column_str}]
-- Data Types: [{dtypes_str}]
-- Total Rows: {len(df)}
-
-Sample Data (First 3 Rows):
-{header_row}
-{separator_row}
-{chr(10).join(data_rows)}
-"""
-    
-    # Save to file if requested
-    if save_to_file:
-        with open("outputs/context.txt", "w") as f:
-            f.write(context)
-        print("✅ Context saved to outputs/context.txt")
-    
+    context = "".join([
+        "DATA SCHEMA:\n",
+        f"- Columns: [{column_str}]\n",
+        f"- Data Types: [{dtypes_str}]\n",
+        f"- Total Rows: {total_rows}\n",
+        "\n",
+        "Sample Data (First 3 Rows):\n",
+        sample_md,
+        "\n",
+    ])
+
     return context
 
 
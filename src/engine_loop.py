@@ -6,9 +6,17 @@ Supports parameterized paths for multi-scenario testing.
 """
 
 import os
+import io
+import ast
 import sys
 import subprocess
 import json
+import traceback
+import threading
+import importlib.util
+from functools import lru_cache
+
+import pandas as pd
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -18,15 +26,38 @@ from src.context_loader import get_csv_context
 
 MAX_RETRIES = 3
 GENERATED_FILE = "outputs/generated_filter.py"
+VERIFIED_FILE = "outputs/verified_filter.py"
+
+
+@lru_cache(maxsize=8)
+def _read_file(path: str, mtime: float) -> str:
+    """Read a small input file, memoized on (path, mtime) so retries skip the I/O."""
+    with open(path, "r") as f:
+        return f.read()
 
 
-def load_inputs(context_path: str = "outputs/context.txt", rules_path: str = "outputs/rules.json") -> tuple[str, str]:
-    """Load schema and rules from Sprint 2 output files."""
-    with open(context_path, "r") as f:
-        schema_str = f.read()
-    with open(rules_path, "r") as f:
-        rules_json = f.read()
-    return schema_str, rules_json
+def read_input(path: str) -> str:
+    """Read schema/rules input through the mtime-keyed cache."""
+    return _read_file(path, os.path.getmtime(path))
+
+
+def load_inputs(
+    context_path: str = "outputs/context.txt",
+    rules_path: str = "outputs/rules.json",
+    csv_path: str | None = None,
+) -> tuple[str, str]:
+    """
+    Load schema and rules from Sprint 2 output files.
+    Falls back to profiling csv_path when the context file is missing.
+    """
+    if os.path.exists(context_path):
+        schema_str = read_input(context_path)
+    elif csv_path is not None:
+        schema_str = get_csv_context(csv_path)
+    else:
+        raise FileNotFoundError(f"Context file not found: {context_path}")
+
+    return schema_str, read_input(rules_path)
 
 
 def save_code(code: str, file_path: str) -> None:
@@ -35,77 +66,262 @@ def save_code(code: str, file_path: str) -> None:
         f.write(code)
 
 
-def execute_code(file_path: str) -> tuple[bool, str, str]:
+EXEC_TIMEOUT = 30
+
+# The Architect contract allows only pandas and numpy; since generated code
+# now runs in-process, anything else is rejected before exec
+_ALLOWED_IMPORTS = {"pandas", "numpy"}
+
+
+class _ThreadLocalStream(io.TextIOBase):
     """
-    Execute the generated Python script in a subprocess.
-    
+    stdout/stderr proxy: threads that registered a sink write into it, every
+    other thread passes through to the real stream. Unlike the process-global
+    contextlib.redirect_stdout, this lets one thread capture a generated
+    script's output while concurrent run_engine threads keep printing to the
+    console — and none of their lines leak into the captured output that gets
+    fed back to the Architect.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, sink) -> None:
+        self._local.sink = sink
+
+    def unregister(self) -> None:
+        self._local.sink = None
+
+    def write(self, s: str) -> int:
+        sink = getattr(self._local, "sink", None)
+        return (self._fallback if sink is None else sink).write(s)
+
+    def flush(self) -> None:
+        sink = getattr(self._local, "sink", None)
+        (self._fallback if sink is None else sink).flush()
+
+
+_PROXY_INSTALL_LOCK = threading.Lock()
+_STDOUT_PROXY: _ThreadLocalStream | None = None
+_STDERR_PROXY: _ThreadLocalStream | None = None
+
+
+def _install_capture_proxies() -> None:
+    """Swap sys.stdout/stderr for the thread-local proxies (once per process)."""
+    global _STDOUT_PROXY, _STDERR_PROXY
+    with _PROXY_INSTALL_LOCK:
+        if _STDOUT_PROXY is None:
+            _STDOUT_PROXY = _ThreadLocalStream(sys.stdout)
+            _STDERR_PROXY = _ThreadLocalStream(sys.stderr)
+            sys.stdout = _STDOUT_PROXY
+            sys.stderr = _STDERR_PROXY
+
+
+def _validate_ast(code: str) -> str | None:
+    """
+    Static check of generated code before in-process execution.
+
     Returns:
-        (success: bool, stdout: str, stderr: str)
+        An error message if the code is rejected, None if it is acceptable.
     """
-    python_exe = sys.executable
-    
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return f"SyntaxError in generated code: {e}"
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] not in _ALLOWED_IMPORTS:
+                    return f"Disallowed import: {alias.name}"
+        elif isinstance(node, ast.ImportFrom):
+            if (node.module or "").split(".")[0] not in _ALLOWED_IMPORTS:
+                return f"Disallowed import: from {node.module}"
+    return None
+
+
+def _exec_module(file_path: str) -> tuple[bool, str, str]:
+    """Execute the script in-process with this thread's stdout/stderr captured."""
+    buf, errbuf = io.StringIO(), io.StringIO()
+    # Spec name "__main__" so the script's `if __name__ == "__main__"` block runs
+    spec = importlib.util.spec_from_file_location("__main__", file_path)
+    module = importlib.util.module_from_spec(spec)
+
+    _install_capture_proxies()
+    _STDOUT_PROXY.register(buf)
+    _STDERR_PROXY.register(errbuf)
+    try:
+        spec.loader.exec_module(module)
+    except SystemExit as e:
+        # Scripts may end with exit(0) — match the old subprocess semantics,
+        # where the exit code (not the exception) decided success
+        if e.code not in (None, 0):
+            errbuf.write(f"SystemExit: {e.code}\n")
+            return False, buf.getvalue(), errbuf.getvalue()
+    except BaseException:
+        # BaseException: a bare SystemExit/KeyboardInterrupt subclass must
+        # not escape into the worker thread, which would swallow it silently
+        errbuf.write(traceback.format_exc())
+        return False, buf.getvalue(), errbuf.getvalue()
+    finally:
+        _STDOUT_PROXY.unregister()
+        _STDERR_PROXY.unregister()
+    return True, buf.getvalue(), errbuf.getvalue()
+
+
+# A thread cannot be killed, so after the first runaway script (e.g. an
+# infinite loop, which _validate_ast cannot see) every later execution in
+# this process takes the killable subprocess path instead.
+_TIMED_OUT_ONCE = threading.Event()
+
+
+def _execute_in_subprocess(file_path: str) -> tuple[bool, str, str]:
+    """Killable execution path: fresh interpreter, hard EXEC_TIMEOUT kill."""
     result = subprocess.run(
-        [python_exe, file_path],
+        [sys.executable, file_path],
         capture_output=True,
         text=True,
-        timeout=30
+        timeout=EXEC_TIMEOUT,
     )
-    
     success = result.returncode == 0 and "PROCESS_COMPLETE" in result.stdout
     return success, result.stdout, result.stderr
 
 
-def validate_output(output_path: str, expected: dict | None = None) -> tuple[bool, str]:
+def execute_code(file_path: str) -> tuple[bool, str, str]:
+    """
+    Execute the generated Python script.
+
+    The fast path runs in-process so pandas/numpy stay resident across
+    retries. A script that outlives EXEC_TIMEOUT is abandoned on its daemon
+    thread (its output stays in its thread-local sinks, and it cannot block
+    interpreter exit), and the engine stops trusting in-process execution —
+    subsequent attempts run in a subprocess, which can actually be killed.
+
+    Returns:
+        (success: bool, stdout: str, stderr: str)
+    """
+    with open(file_path, "r") as f:
+        code = f.read()
+    ast_error = _validate_ast(code)
+    if ast_error:
+        # Fed back to the Architect like any runtime error
+        return False, "", f"AST VALIDATION FAIL: {ast_error}"
+
+    if _TIMED_OUT_ONCE.is_set():
+        return _execute_in_subprocess(file_path)
+
+    result: dict = {}
+
+    def _worker():
+        result["value"] = _exec_module(file_path)
+
+    worker = threading.Thread(target=_worker, daemon=True, name="generated-filter-exec")
+    worker.start()
+    worker.join(EXEC_TIMEOUT)
+    if worker.is_alive():
+        _TIMED_OUT_ONCE.set()
+        # Same exception the old subprocess path raised, so run_engine's
+        # timeout handling is unchanged
+        raise subprocess.TimeoutExpired(cmd=file_path, timeout=EXEC_TIMEOUT)
+
+    outcome = result.get("value")
+    if outcome is None:
+        # Worker finished without reporting a result — degrade to a retryable
+        # failure fed back to the Architect instead of crashing the scenario
+        return False, "", "Execution worker exited without a result."
+
+    ran_clean, stdout, stderr = outcome
+    success = ran_clean and "PROCESS_COMPLETE" in stdout
+    return success, stdout, stderr
+
+
+def validate_counts(df: pd.DataFrame, expected: dict) -> bool:
+    """
+    Check a classified frame's Status distribution against expected counts in
+    one hashed value_counts pass — no per-key Python iteration.
+    """
+    actual = df["Status"].value_counts().reindex(list(expected), fill_value=0).astype(int)
+    return actual.to_dict() == expected
+
+
+def validate_output(output_path: str, expected: dict | None = None, verbose: bool = True) -> tuple[bool, str]:
     """
     Post-execution validation of the generated CSV.
-    
+
     Args:
         output_path: Path to the filtered_results.csv
         expected: Optional dict with expected status counts, e.g.
                   {"Normal": 80, "Liquidation": 10, "Review": 5, "VIP_Keep": 5}
-    
+        verbose: When False, skip the per-status report formatting — callers
+                 that only need the pass/fail (intermediate retries) avoid the
+                 Python-level string building. Mismatches are always reported.
+
     Returns:
         (valid: bool, report: str)
     """
-    import pandas as pd
-    
     if not os.path.exists(output_path):
         return False, f"Output file {output_path} not found"
-    
-    df = pd.read_csv(output_path)
-    
-    # Check 1: Status column exists
-    if "Status" not in df.columns:
+
+    # Only the Status column matters here — project it at parse time so
+    # validation I/O doesn't scale with the number of data columns
+    try:
+        df = pd.read_csv(output_path, usecols=["Status"], engine="pyarrow")
+    except (ValueError, KeyError):
+        # C engine raises ValueError, arrow engine KeyError, for a missing column
         return False, "VALIDATION FAIL: 'Status' column missing from output"
     
-    # Check 2: No NaN in Status
-    nan_count = df["Status"].isna().sum()
+    # Checks 2+3 share one pass over the column: value_counts(dropna=False)
+    # yields the NaN count and the per-status counts together
+    counts = df["Status"].value_counts(dropna=False)
+    nan_mask = counts.index.isna()
+    nan_count = int(counts[nan_mask].sum())
     if nan_count > 0:
         return False, f"VALIDATION FAIL: {nan_count} rows have NaN Status"
-    
-    # Check 3: Row count preserved
-    actual_counts = df["Status"].value_counts().to_dict()
-    
+
+    actual_counts = counts[~nan_mask].to_dict()
+
     report_lines = ["📊 Validation Report:"]
-    report_lines.append(f"   Total rows: {len(df)}")
-    report_lines.append(f"   Status distribution:")
-    for status, count in sorted(actual_counts.items()):
-        report_lines.append(f"     {status}: {count}")
-    
-    # Check 4: Expected counts (if provided)
+    if verbose:
+        report_lines.append(f"   Total rows: {len(df)}")
+        report_lines.append(f"   Status distribution:")
+        for status, count in sorted(actual_counts.items()):
+            report_lines.append(f"     {status}: {count}")
+
+    # Check 4: Expected counts (if provided) — align actuals to the expected
+    # keys and compare in one vectorized pass instead of per-key dict lookups
     if expected:
-        mismatches = []
-        for status, exp_count in expected.items():
-            actual = actual_counts.get(status, 0)
-            match = "✅" if actual == exp_count else "❌"
-            if actual != exp_count:
-                mismatches.append(f"{status}: expected {exp_count}, got {actual}")
-            report_lines.append(f"   {match} {status}: expected={exp_count}, actual={actual}")
-        
-        if mismatches:
+        if not verbose and validate_counts(df, expected):
+            return True, ""
+
+        exp_series = pd.Series(expected, name="expected")
+        act_series = (
+            pd.Series(actual_counts, name="actual")
+            .reindex(exp_series.index, fill_value=0)
+            .astype(int)
+        )
+        matches = exp_series == act_series
+
+        if verbose:
+            for status in exp_series.index:
+                icon = "✅" if matches[status] else "❌"
+                report_lines.append(
+                    f"   {icon} {status}: expected={exp_series[status]}, actual={act_series[status]}"
+                )
+
+        if not matches.all():
+            if not verbose:
+                # Mismatches always make it into the Architect feedback
+                for status in exp_series.index[~matches]:
+                    report_lines.append(
+                        f"   ❌ {status}: expected={exp_series[status]}, actual={act_series[status]}"
+                    )
             report = "\n".join(report_lines)
             return False, f"VALIDATION FAIL: Mismatched counts\n{report}"
-    
+
+    if not verbose:
+        return True, ""
+
     report = "\n".join(report_lines)
     return True, report
 
@@ -116,11 +332,13 @@ def run_engine(
     rules_path: str = "outputs/rules.json",
     output_path: str = "outputs/filtered_results.csv",
     expected: dict | None = None,
-    scenario_name: str = "Default"
+    scenario_name: str = "Default",
+    generated_file: str = GENERATED_FILE,
+    verified_file: str = VERIFIED_FILE,
 ) -> dict:
     """
     Main engine loop with validation.
-    
+
     Args:
         csv_path: Path to input CSV
         context_path: Path to schema context file
@@ -128,6 +346,11 @@ def run_engine(
         output_path: Path to output CSV
         expected: Expected status counts for validation
         scenario_name: Name for logging
+        generated_file: Where to save generated code — give concurrent
+            scenarios distinct paths so they don't overwrite each other
+        verified_file: Where to save the validated code. The default is the
+            production filter consumed by the runtime; concurrent scenarios
+            must pass distinct paths so they don't race over it
     
     Returns:
         Result dict with keys: success, attempts, validation, code
@@ -144,14 +367,8 @@ def run_engine(
         "code": ""
     }
     
-    # Step 1: Load or generate context
-    if os.path.exists(context_path):
-        schema_str = open(context_path).read()
-    else:
-        schema_str = get_csv_context(csv_path)
-    
-    with open(rules_path, "r") as f:
-        rules_json = f.read()
+    # Step 1: Load schema + rules through the memoized loader
+    schema_str, rules_json = load_inputs(context_path, rules_path, csv_path)
     
     print(f"✅ Loaded schema from {context_path}")
     print(f"✅ Loaded rules from {rules_path}")
@@ -166,13 +383,13 @@ def run_engine(
         print(f"\n--- Attempt {attempt}/{MAX_RETRIES} ---")
         
         # Save code
-        save_code(current_code, GENERATED_FILE)
-        print(f"💾 Saved code to {GENERATED_FILE} ({len(current_code)} chars)")
+        save_code(current_code, generated_file)
+        print(f"💾 Saved code to {generated_file} ({len(current_code)} chars)")
         
         # Execute
-        print(f"⚡ Executing {GENERATED_FILE}...")
+        print(f"⚡ Executing {generated_file}...")
         try:
-            exec_success, stdout, stderr = execute_code(GENERATED_FILE)
+            exec_success, stdout, stderr = execute_code(generated_file)
         except subprocess.TimeoutExpired:
             print("⏰ Execution timed out (30s limit)")
             stderr = "TimeoutError: Script execution exceeded 30 seconds."
@@ -184,7 +401,9 @@ def run_engine(
             
             # Step 4: VALIDATION
             print(f"\n🔍 Running validation...")
-            valid, val_report = validate_output(output_path, expected)
+            valid, val_report = validate_output(
+                output_path, expected, verbose=(attempt == MAX_RETRIES)
+            )
             result["validation_report"] = val_report
             print(val_report)
             
@@ -194,8 +413,8 @@ def run_engine(
                 result["code"] = current_code
                 
                 # Save verified version
-                save_code(current_code, "outputs/verified_filter.py")
-                print(f"\n💾 Verified code saved to outputs/verified_filter.py")
+                save_code(current_code, verified_file)
+                print(f"\n💾 Verified code saved to {verified_file}")
                 
                 print(f"\n{'=' * 70}")
                 print(f"✅ SCENARIO '{scenario_name}': PASSED on attempt {attempt}")
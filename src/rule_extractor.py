@@ -1,15 +1,21 @@
 """
 rule_extractor.py
-Extracts SOP rules from sops.txt using LangGraph and gpt-oss-120b via Cerebras.
+Extracts SOP rules from sops.txt using gpt-oss-120b via Cerebras.
 """
 
-import json
 import os
+import re
+import orjson
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
-from langgraph.graph import StateGraph
 from typing_extensions import TypedDict
 import requests
+from requests.adapters import HTTPAdapter
+
+# Pooled session shared across extractions — keep-alive skips the TLS
+# handshake when rules are re-extracted in the same process.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 # Pydantic Models
@@ -54,9 +60,9 @@ class RuleSet(BaseModel):
     )
 
 
-# LangGraph State
+# Extraction State
 class RuleExtractorState(TypedDict):
-    """State for the rule extraction graph."""
+    """State for the rule extraction pipeline."""
     sops_text: str
     extracted_rules: Optional[RuleSet]
     error: Optional[str]
@@ -93,10 +99,11 @@ def extract_rules_node(state: RuleExtractorState) -> RuleExtractorState:
         "Content-Type": "application/json"
     }
     
-    # Build extraction prompt
-    prompt = f"""You are an expert at parsing Standard Operating Procedures (SOPs).
+    # Fixed extraction instructions go in the system message so providers
+    # with prompt-prefix caching only pay for the SOP text per call
+    system_prompt = """You are an expert at parsing Standard Operating Procedures (SOPs).
 
-Read the following SOP rules and extract them into a structured JSON format.
+Read the SOP rules provided by the user and extract them into a structured JSON format.
 
 For each rule, identify:
 1. rule_id: A numeric identifier (1, 2, 3, etc.)
@@ -104,44 +111,46 @@ For each rule, identify:
 3. condition_logic: Plain English description of what triggers the rule
 4. exception_logic: Plain English description of any exceptions (or null if none)
 
-SOP TEXT:
-{sops_text}
-
 Return ONLY a valid JSON object matching this schema:
-{{
+{
   "rules": [
-    {{
+    {
       "rule_id": 1,
       "rule_name": "Name",
       "condition_logic": "Description",
       "exception_logic": "Description or null"
-    }}
+    }
   ],
   "total_rules": <count>
-}}
+}
 """
-    
+
     try:
         # Try Cerebras API first
         data = {
             "model": "gpt-oss-120b",
             "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": f"SOP TEXT:\n{sops_text}"
                 }
             ],
             "max_tokens": 1024,
             "temperature": 0.1
         }
-        
-        response = requests.post(url, headers=headers, json=data)
+
+        response = _SESSION.post(url, headers=headers, json=data, timeout=30)
         
         if response.status_code != 200:
             state["error"] = f"Cerebras API error: {response.status_code} - {response.text}"
             return state
         
-        response_data = response.json()
+        # orjson parses the raw bytes directly — no text decode + stdlib re-parse
+        response_data = orjson.loads(response.content)
         response_text = response_data["choices"][0]["message"]["content"]
         
         # Parse JSON
@@ -153,13 +162,13 @@ Return ONLY a valid JSON object matching this schema:
             return state
         
         json_str = response_text[json_start:json_end]
-        rules_dict = json.loads(json_str)
+        rules_dict = orjson.loads(json_str)
         
         # Validate with Pydantic
         ruleset = RuleSet(**rules_dict)
         state["extracted_rules"] = ruleset
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         state["error"] = f"JSON parsing error: {str(e)}"
     except Exception as e:
         # Fallback: Return manual parsing result
@@ -169,31 +178,43 @@ Return ONLY a valid JSON object matching this schema:
     return state
 
 
+# Compiled once at import: one case-insensitive pass finds every SOP keyword
+# group, instead of repeated .upper() copies and substring scans per rule
+_SOP_PATTERNS = re.compile(
+    r"(?P<liq>LIQUIDATION)"
+    r"|(?P<low>LOW MARGIN|PROFIT.{0,40}5)"
+    r"|(?P<vip>VIP|EXCEPTION)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def _fallback_parse_rules(state: RuleExtractorState, sops_text: str) -> RuleExtractorState:
     """
     Fallback parser: Manually extract rules from SOP text without LLM.
     """
     try:
         rules = []
-        
+
         # Simple manual extraction based on known SOP structure
-        if "LIQUIDATION" in sops_text.upper():
+        matched = {m.lastgroup for m in _SOP_PATTERNS.finditer(sops_text)}
+
+        if "liq" in matched:
             rules.append({
                 "rule_id": 1,
                 "rule_name": "Liquidation Trigger",
                 "condition_logic": "If Days_in_Warehouse > 180",
                 "exception_logic": None
             })
-        
-        if "LOW MARGIN" in sops_text.upper() or "PROFIT" in sops_text.upper() and "5" in sops_text:
+
+        if "low" in matched:
             rules.append({
                 "rule_id": 2,
                 "rule_name": "Low Margin Warning",
                 "condition_logic": "If Profit_Per_Item < $5",
                 "exception_logic": None
             })
-        
-        if "VIP" in sops_text.upper() or "EXCEPTION" in sops_text.upper():
+
+        if "vip" in matched:
             rules.append({
                 "rule_id": 3,
                 "rule_name": "VIP Exception",
@@ -210,21 +231,6 @@ def _fallback_parse_rules(state: RuleExtractorState, sops_text: str) -> RuleExtr
     return state
 
 
-def build_rule_extractor_graph():
-    """
-    Build and return the rule extraction graph.
-    
-    Returns:
-        Compiled LangGraph
-    """
-    graph = StateGraph(RuleExtractorState)
-    graph.add_node("extract_rules", extract_rules_node)
-    graph.set_entry_point("extract_rules")
-    graph.set_finish_point("extract_rules")
-    
-    return graph.compile()
-
-
 def extract_rules_from_file(file_path: str, save_to_file: bool = False) -> RuleSet | None:
     """
     Convenience function: Read SOP file and extract rules.
@@ -246,16 +252,15 @@ def extract_rules_from_file(file_path: str, save_to_file: bool = False) -> RuleS
         print(f"ERROR: Failed to read file: {str(e)}")
         return None
     
-    # Build and run graph
-    graph = build_rule_extractor_graph()
-    
-    initial_state = {
+    # Single-node pipeline: call the node directly — wrapping one function in
+    # a StateGraph only added compile + invoke dispatch overhead per call
+    initial_state: RuleExtractorState = {
         "sops_text": sops_text,
         "extracted_rules": None,
         "error": None
     }
-    
-    final_state = graph.invoke(initial_state)
+
+    final_state = extract_rules_node(initial_state)
     
     if final_state["error"]:
         print(f"ERROR: {final_state['error']}")
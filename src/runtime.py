@@ -7,22 +7,36 @@ calculates summary stats, saves violations.csv + summary_stats.json.
 
 import os
 import sys
-import json
+import orjson
 import importlib.util
 import pandas as pd
 
+# Copy-on-write is always on from pandas 3.0; opt in explicitly on 2.x so the
+# pipeline can hand apply_filters the loaded frame without an eager full copy.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 # Paths (relative to project root)
 DATA_CSV = "data/mock_data.csv"
 VERIFIED_FILTER = "outputs/verified_filter.py"
 VIOLATIONS_CSV = "outputs/violations.csv"
 SUMMARY_JSON = "outputs/summary_stats.json"
 FILTERED_CSV = "outputs/filtered_results.csv"
+VIOLATIONS_PARQUET = "outputs/violations.parquet"
+FILTERED_PARQUET = "outputs/filtered_results.parquet"
+
+
+# Loaded filters keyed on (abs_path, mtime) — repeated pipeline runs against
+# the same verified filter skip the re-parse/re-exec of the module
+_FILTER_CACHE: dict[tuple[str, float], object] = {}
 
 
 def load_verified_filter(filter_path: str = VERIFIED_FILTER):
     """
     Dynamically import apply_filters() from verified_filter.py.
-    
+    The compiled module is cached by (path, mtime), so only the first call
+    (or a regenerated filter) pays the import/exec cost.
+
     Returns:
         The apply_filters function callable.
     """
@@ -32,14 +46,19 @@ def load_verified_filter(filter_path: str = VERIFIED_FILTER):
             f"verified_filter.py not found at {abs_path}. "
             "Run the engine loop first (Sprint 3) to generate it."
         )
-    
+
+    key = (abs_path, os.path.getmtime(abs_path))
+    if key in _FILTER_CACHE:
+        return _FILTER_CACHE[key]
+
     spec = importlib.util.spec_from_file_location("verified_filter", abs_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-    
+
     if not hasattr(module, "apply_filters"):
         raise AttributeError("verified_filter.py has no apply_filters() function")
-    
+
+    _FILTER_CACHE[key] = module.apply_filters
     return module.apply_filters
 
 
@@ -49,6 +68,7 @@ def run_pipeline(
     violations_path: str = VIOLATIONS_CSV,
     summary_path: str = SUMMARY_JSON,
     filtered_path: str = FILTERED_CSV,
+    write_csv: bool = True,
 ) -> dict:
     """
     Full runtime pipeline:
@@ -66,69 +86,96 @@ def run_pipeline(
     
     # Step 1: Load data
     print(f"\n📂 Loading data from {csv_path}...")
-    df = pd.read_csv(csv_path)
+    # PyArrow engine: multithreaded SIMD parsing, same numpy-backed frame out
+    df = pd.read_csv(csv_path, engine="pyarrow")
     total_rows = len(df)
     print(f"   Loaded {total_rows} rows, {len(df.columns)} columns")
+
+    # Narrow numeric dtypes (rung 5): currency/age columns don't need 64 bits,
+    # and every downstream mask/sum moves half the bytes. Guarded per column
+    # so non-Titan schemas pass through untouched.
+    narrow = {
+        col: dtype
+        for col, dtype in {
+            "Price": "float32",
+            "Profit_Per_Item": "float32",
+            "Days_in_Warehouse": "int32",
+        }.items()
+        if col in df.columns
+    }
+    if narrow:
+        df = df.astype(narrow)
     
     # Step 2: Dynamically import and apply filter
     print(f"\n⚡ Loading filter from {filter_path}...")
     apply_filters = load_verified_filter(filter_path)
-    df_filtered = apply_filters(df.copy())
+    df_filtered = apply_filters(df)
+    # Categorical status: 1-byte codes instead of a Python string per row,
+    # and value_counts/groupby below take the categorical fast path
+    df_filtered["Status"] = df_filtered["Status"].astype("category")
     print(f"   ✅ Filters applied. Status distribution:")
-    
+
     status_counts = df_filtered["Status"].value_counts().to_dict()
     for status, count in sorted(status_counts.items()):
         print(f"      {status}: {count}")
     
-    # Step 3: Save full filtered results
-    df_filtered.to_csv(filtered_path, index=False)
-    print(f"\n💾 Full results saved to {filtered_path}")
-    
+    # Step 3: Save full filtered results — Parquet is the primary artifact
+    # (columnar, zstd, no per-row text formatting); CSV kept for inspection
+    filtered_parquet = filtered_path.replace(".csv", ".parquet")
+    df_filtered.to_parquet(filtered_parquet, engine="pyarrow", compression="zstd", index=False)
+    if write_csv:
+        df_filtered.to_csv(filtered_path, index=False)
+    print(f"\n💾 Full results saved to {filtered_parquet}")
+
     # Step 4: Extract violations (anything NOT 'Normal')
     violations = df_filtered[df_filtered["Status"] != "Normal"].copy()
-    violations.to_csv(violations_path, index=False)
-    print(f"💾 Violations saved to {violations_path} ({len(violations)} rows)")
-    
-    # Step 5: Calculate summary stats
-    liquidation_items = df_filtered[df_filtered["Status"] == "Liquidation"]
-    review_items = df_filtered[df_filtered["Status"] == "Review"]
-    vip_items = df_filtered[df_filtered["Status"] == "VIP_Keep"]
-    normal_items = df_filtered[df_filtered["Status"] == "Normal"]
-    
-    # Trapped Capital = total Price of Liquidation items
-    trapped_capital = float(liquidation_items["Price"].sum()) if len(liquidation_items) > 0 else 0.0
-    
-    # Lost margin = total Profit_Per_Item of Review items (low-margin items)
-    lost_margin = float(review_items["Profit_Per_Item"].sum()) if len(review_items) > 0 else 0.0
-    
-    # VIP saved value = total Price of VIP_Keep items
-    vip_saved_value = float(vip_items["Price"].sum()) if len(vip_items) > 0 else 0.0
-    
+    violations_parquet = violations_path.replace(".csv", ".parquet")
+    violations.to_parquet(violations_parquet, engine="pyarrow", compression="zstd", index=False)
+    if write_csv:
+        violations.to_csv(violations_path, index=False)
+    print(f"💾 Violations saved to {violations_parquet} ({len(violations)} rows)")
+    
+    # Step 5: Calculate summary stats — one grouped pass over the frame
+    # instead of a boolean-mask slice + reduction per status
+    agg = (
+        df_filtered.groupby("Status", observed=True)
+        .agg(
+            price_sum=("Price", "sum"),
+            profit_sum=("Profit_Per_Item", "sum"),
+            profit_mean=("Profit_Per_Item", "mean"),
+            days_mean=("Days_in_Warehouse", "mean"),
+        )
+        .reindex(["Normal", "Liquidation", "Review", "VIP_Keep"], fill_value=0)
+    )
+    liquidation = agg.loc["Liquidation"]
+    review = agg.loc["Review"]
+    vip = agg.loc["VIP_Keep"]
+
     summary = {
         "total_items": total_rows,
         "normal_items": int(status_counts.get("Normal", 0)),
         "liquidation": {
             "count": int(status_counts.get("Liquidation", 0)),
-            "trapped_capital": round(trapped_capital, 2),
-            "avg_days_in_warehouse": round(float(liquidation_items["Days_in_Warehouse"].mean()), 1) if len(liquidation_items) > 0 else 0,
+            "trapped_capital": round(float(liquidation["price_sum"]), 2),
+            "avg_days_in_warehouse": round(float(liquidation["days_mean"]), 1),
         },
         "review": {
             "count": int(status_counts.get("Review", 0)),
-            "total_lost_margin": round(lost_margin, 2),
-            "avg_profit": round(float(review_items["Profit_Per_Item"].mean()), 2) if len(review_items) > 0 else 0,
+            "total_lost_margin": round(float(review["profit_sum"]), 2),
+            "avg_profit": round(float(review["profit_mean"]), 2),
         },
         "vip_keep": {
             "count": int(status_counts.get("VIP_Keep", 0)),
-            "saved_value": round(vip_saved_value, 2),
-            "avg_profit": round(float(vip_items["Profit_Per_Item"].mean()), 2) if len(vip_items) > 0 else 0,
+            "saved_value": round(float(vip["price_sum"]), 2),
+            "avg_profit": round(float(vip["profit_mean"]), 2),
         },
         "total_violations": len(violations),
         "violation_rate": round(len(violations) / total_rows * 100, 1),
     }
     
-    # Save summary
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    # Save summary — orjson serializes to bytes in one C call
+    with open(summary_path, "wb") as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     print(f"💾 Summary stats saved to {summary_path}")
     
     # Print summary